@@ -0,0 +1,16 @@
+"""Builds the optional roadcolor._ckernels extension; metadata lives in pyproject.toml."""
+
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # no Cython: install the pure-Python package only
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        # optional=True: a missing compiler falls back to the pure-Python kernels
+        [Extension("roadcolor._ckernels", ["src/roadcolor/_ckernels.pyx"], optional=True)],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
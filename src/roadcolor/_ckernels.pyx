@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled color kernels.
+
+Optional: build in place with ``cythonize -i src/roadcolor/_ckernels.pyx``.
+color.py prefers these over the numba kernels when the extension is present.
+"""
+
+from libc.math cimport fabs
+
+# Channel order of (C, X, 0) for each 60-degree hue sector
+cdef int[6][3] _HSL_SECTORS = [[0, 1, 2], [1, 0, 2], [2, 0, 1], [2, 1, 0], [1, 2, 0], [0, 2, 1]]
+
+
+def rgb_to_hsl(double r, double g, double b):
+    cdef double maxc, minc, l, d, s, h
+    r, g, b = r / 255, g / 255, b / 255
+    maxc = r if r > g else g
+    maxc = maxc if maxc > b else b
+    minc = r if r < g else g
+    minc = minc if minc < b else b
+    l = (maxc + minc) / 2
+    if maxc == minc:
+        return 0, 0, <long>(l * 100)
+    d = maxc - minc
+    s = d / (maxc + minc) if l <= 0.5 else d / (2 - maxc - minc)
+    if r == maxc:
+        h = ((g - b) / d) % 6
+    elif g == maxc:
+        h = (b - r) / d + 2
+    else:
+        h = (r - g) / d + 4
+    return <long>(h * 60), <long>(s * 100), <long>(l * 100)
+
+
+def hsl_to_rgb(double h, double s, double l):
+    cdef double c, hp, x, m
+    cdef double v[3]
+    cdef int sector
+    s, l = s / 100, l / 100
+    c = (1 - fabs(2 * l - 1)) * s
+    hp = h / 60
+    x = c * (1 - fabs(hp % 2 - 1))
+    m = l - c / 2
+    v[0] = c + m
+    v[1] = x + m
+    v[2] = m
+    sector = (<int>hp) % 6
+    return (
+        <long>(v[_HSL_SECTORS[sector][0]] * 255),
+        <long>(v[_HSL_SECTORS[sector][1]] * 255),
+        <long>(v[_HSL_SECTORS[sector][2]] * 255),
+    )
+
+
+def gradient_rgb(const unsigned char[::1] start, const unsigned char[::1] end,
+                 unsigned char[:, ::1] out):
+    """Fill ``out`` (shape (n, 3)) with the fixed-point blend of ``start`` into ``end``."""
+    cdef Py_ssize_t n = out.shape[0], i, c
+    cdef double d = n - 1 if n > 1 else 1
+    cdef unsigned int k
+    for i in range(n):
+        k = <unsigned int>(i / d * 256)
+        for c in range(3):
+            out[i, c] = (start[c] * (256 - k) + end[c] * k) >> 8
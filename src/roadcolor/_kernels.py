@@ -0,0 +1,80 @@
+"""
+Numba-compiled color kernels.
+
+Optional: importing this module requires numba. color.py routes its
+scalar RGB/HSL conversions through these when the import succeeds.
+"""
+
+from numba import njit, prange
+import numpy as np
+
+# Channel order of (C, X, 0) for each 60-degree hue sector
+_HSL_SECTORS = np.array(
+    [[0, 1, 2], [1, 0, 2], [2, 0, 1], [2, 1, 0], [1, 2, 0], [0, 2, 1]], dtype=np.int64
+)
+
+
+@njit(cache=True)
+def rgb_to_hsl(r, g, b):
+    r, g, b = r / 255, g / 255, b / 255
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    l = (maxc + minc) / 2
+    if maxc == minc:
+        return 0, 0, int(l * 100)
+    d = maxc - minc
+    s = d / (maxc + minc) if l <= 0.5 else d / (2 - maxc - minc)
+    if r == maxc:
+        h = ((g - b) / d) % 6
+    elif g == maxc:
+        h = (b - r) / d + 2
+    else:
+        h = (r - g) / d + 4
+    return int(h * 60), int(s * 100), int(l * 100)
+
+
+@njit(cache=True)
+def hsl_to_rgb(h, s, l):
+    s, l = s / 100, l / 100
+    c = (1 - abs(2 * l - 1)) * s
+    hp = h / 60
+    x = c * (1 - abs(hp % 2 - 1))
+    m = l - c / 2
+    v = (c + m, x + m, m)
+    order = _HSL_SECTORS[int(hp) % 6]
+    return int(v[order[0]] * 255), int(v[order[1]] * 255), int(v[order[2]] * 255)
+
+
+@njit(parallel=True, cache=True)
+def rgb_to_hsl_array(rgb):
+    """Convert an (N, 3) RGB array to an (N, 3) int64 array of (h, s, l)."""
+    n = rgb.shape[0]
+    out = np.empty((n, 3), dtype=np.int64)
+    for i in prange(n):
+        out[i, 0], out[i, 1], out[i, 2] = rgb_to_hsl(rgb[i, 0], rgb[i, 1], rgb[i, 2])
+    return out
+
+
+@njit(parallel=True, cache=True)
+def hsl_to_rgb_array(hsl):
+    """Convert an (N, 3) array of (h, s, l) to an (N, 3) uint8 RGB array."""
+    n = hsl.shape[0]
+    out = np.empty((n, 3), dtype=np.uint8)
+    for i in prange(n):
+        r, g, b = hsl_to_rgb(hsl[i, 0], hsl[i, 1], hsl[i, 2])
+        out[i, 0] = r
+        out[i, 1] = g
+        out[i, 2] = b
+    return out
+
+
+@njit(parallel=True, cache=True)
+def gradient(start, end, steps):
+    """Fill a (steps, 3) uint8 array blending ``start`` into ``end``."""
+    out = np.empty((steps, 3), dtype=np.uint8)
+    d = steps - 1 if steps > 1 else 1
+    for i in prange(steps):
+        k = int(i / d * 256)
+        for c in range(3):
+            out[i, c] = (start[c] * (256 - k) + end[c] * k) >> 8
+    return out
@@ -4,32 +4,153 @@ Color conversion, blending, and palette generation.
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 import colorsys
 import logging
 import re
 
-logger = logging.getLogger(__name__)
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batch helpers fall back to pure Python
+    np = None
+
+try:
+    from . import _ckernels
+except ImportError:  # the compiled extension is optional and built separately
+    _ckernels = None
 
+# Still wanted alongside _ckernels: only numba provides the array kernels
+try:
+    from . import _kernels
+except ImportError:  # numba is optional; conversions stay in pure Python
+    _kernels = None
+
+logger = logging.getLogger(__name__)
 
-@dataclass
+# One pass classifies and extracts hex, rgb() and hsl() strings; the
+# matched alternative is identified by match.lastgroup
+_COLOR_RE = re.compile(
+    r"#(?P<hex>[0-9a-f]{6}|[0-9a-f]{3}\Z)"
+    r"|rgba?\((?P<r>\d+),\s*(?P<g>\d+),\s*(?P<b>\d+)"
+    r"|hsla?\((?P<h>\d+),\s*(?P<s>\d+)%?,\s*(?P<l>\d+)%?"
+)
+
+# Two-digit lowercase hex for every channel value, indexed by the value
+_HEX = tuple(format(i, "02x") for i in range(256))
+_HEX_ARRAY = np.array(_HEX, dtype="U2") if np is not None else None
+
+# Channel order of (C, X, 0) for each 60-degree hue sector
+_HSL_SECTORS = ((0, 1, 2), (1, 0, 2), (2, 0, 1), (2, 1, 0), (1, 2, 0), (0, 2, 1))
+
+
+def _rgb_to_hsl_py(r: int, g: int, b: int) -> Tuple[int, int, int]:
+    r, g, b = r / 255, g / 255, b / 255
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    l = (maxc + minc) / 2
+    if maxc == minc:
+        return 0, 0, int(l * 100)
+    d = maxc - minc
+    s = d / (maxc + minc) if l <= 0.5 else d / (2 - maxc - minc)
+    if r == maxc:
+        h = ((g - b) / d) % 6
+    elif g == maxc:
+        h = (b - r) / d + 2
+    else:
+        h = (r - g) / d + 4
+    return int(h * 60), int(s * 100), int(l * 100)
+
+
+def _hsl_to_rgb_py(h: int, s: int, l: int) -> Tuple[int, int, int]:
+    s, l = s / 100, l / 100
+    c = (1 - abs(2 * l - 1)) * s
+    hp = h / 60
+    x = c * (1 - abs(hp % 2 - 1))
+    m = l - c / 2
+    v = (c + m, x + m, m)
+    i, j, k = _HSL_SECTORS[int(hp) % 6]
+    return int(v[i] * 255), int(v[j] * 255), int(v[k] * 255)
+
+
+# Scalar conversions used throughout: the compiled extension, then numba,
+# then the pure-Python versions above
+if _ckernels is not None:
+    _rgb_to_hsl = _ckernels.rgb_to_hsl
+    _hsl_to_rgb = _ckernels.hsl_to_rgb
+elif _kernels is not None:
+    _rgb_to_hsl = _kernels.rgb_to_hsl
+    _hsl_to_rgb = _kernels.hsl_to_rgb
+else:
+    _rgb_to_hsl = _rgb_to_hsl_py
+    _hsl_to_rgb = _hsl_to_rgb_py
+
+
+def _rgb_array_to_hsl(rgb: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Elementwise _rgb_to_hsl over a (..., 3) array, returning int h, s, l arrays."""
+    if _kernels is not None:
+        rgb = np.asarray(rgb)
+        hsl = _kernels.rgb_to_hsl_array(rgb.reshape(-1, 3)).reshape(rgb.shape)
+        return hsl[..., 0], hsl[..., 1], hsl[..., 2]
+    rgb = np.asarray(rgb, dtype=float) / 255
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    l = (maxc + minc) / 2
+    d = maxc - minc
+    gray = d == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(l <= 0.5, d / (maxc + minc), d / (2 - maxc - minc))
+        h = np.where(
+            r == maxc, ((g - b) / d) % 6,
+            np.where(g == maxc, (b - r) / d + 2, (r - g) / d + 4),
+        )
+    h = np.where(gray, 0, h)
+    s = np.where(gray, 0, s)
+    return (h * 60).astype(int), (s * 100).astype(int), (l * 100).astype(int)
+
+
+def _hsl_array_to_rgb(h: "np.ndarray", s: "np.ndarray", l: "np.ndarray") -> "np.ndarray":
+    """Elementwise _hsl_to_rgb over broadcastable arrays, returning a (..., 3) integer array."""
+    if _kernels is not None:
+        hsl = np.stack(np.broadcast_arrays(h, s, l), axis=-1)
+        return _kernels.hsl_to_rgb_array(hsl.reshape(-1, 3)).reshape(hsl.shape)
+    h, s, l = np.broadcast_arrays(h, np.asarray(s) / 100, np.asarray(l) / 100)
+    c = (1 - np.abs(2 * l - 1)) * s
+    hp = h / 60
+    x = c * (1 - np.abs(hp % 2 - 1))
+    m = l - c / 2
+    v = np.stack((c + m, x + m, m), axis=-1)
+    order = np.take(np.array(_HSL_SECTORS), hp.astype(int) % 6, axis=0)
+    return (np.take_along_axis(v, order, axis=-1) * 255).astype(int)
+
+
+@dataclass(slots=True, frozen=True)
 class RGB:
     r: int
     g: int
     b: int
 
     def __post_init__(self):
-        self.r = max(0, min(255, self.r))
-        self.g = max(0, min(255, self.g))
-        self.b = max(0, min(255, self.b))
+        r, g, b = self.r, self.g, self.b
+        object.__setattr__(self, "r", r if 0 <= r <= 255 else (0 if r < 0 else 255))
+        object.__setattr__(self, "g", g if 0 <= g <= 255 else (0 if g < 0 else 255))
+        object.__setattr__(self, "b", b if 0 <= b <= 255 else (0 if b < 0 else 255))
+
+    @classmethod
+    def _unchecked(cls, r: int, g: int, b: int) -> "RGB":
+        """Build an RGB from channels already known to be in 0-255, skipping the clamp."""
+        rgb = object.__new__(cls)
+        object.__setattr__(rgb, "r", r)
+        object.__setattr__(rgb, "g", g)
+        object.__setattr__(rgb, "b", b)
+        return rgb
 
     def to_hex(self) -> str:
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return "#" + _HEX[self.r] + _HEX[self.g] + _HEX[self.b]
 
     def to_hsl(self) -> "HSL":
-        r, g, b = self.r / 255, self.g / 255, self.b / 255
-        h, l, s = colorsys.rgb_to_hls(r, g, b)
-        return HSL(int(h * 360), int(s * 100), int(l * 100))
+        return HSL(*_rgb_to_hsl(self.r, self.g, self.b))
 
     def to_hsv(self) -> "HSV":
         r, g, b = self.r / 255, self.g / 255, self.b / 255
@@ -40,6 +161,8 @@ class RGB:
         return (self.r, self.g, self.b)
 
     def luminance(self) -> float:
+        # Keep this exact expression order: folding 1/255 into the weights
+        # shifts grayscale() by one for some grays (e.g. 35 -> 34)
         r, g, b = self.r / 255, self.g / 255, self.b / 255
         return 0.2126 * r + 0.7152 * g + 0.0722 * b
 
@@ -50,21 +173,28 @@ class RGB:
         return self.luminance() <= 0.5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HSL:
     h: int  # 0-360
     s: int  # 0-100
     l: int  # 0-100
 
     def __post_init__(self):
-        self.h = self.h % 360
-        self.s = max(0, min(100, self.s))
-        self.l = max(0, min(100, self.l))
+        object.__setattr__(self, "h", self.h % 360)
+        object.__setattr__(self, "s", max(0, min(100, self.s)))
+        object.__setattr__(self, "l", max(0, min(100, self.l)))
+
+    @classmethod
+    def _unchecked(cls, h: int, s: int, l: int) -> "HSL":
+        """Build an HSL from components already known to be in range, skipping normalisation."""
+        hsl = object.__new__(cls)
+        object.__setattr__(hsl, "h", h)
+        object.__setattr__(hsl, "s", s)
+        object.__setattr__(hsl, "l", l)
+        return hsl
 
     def to_rgb(self) -> RGB:
-        h, s, l = self.h / 360, self.s / 100, self.l / 100
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
-        return RGB(int(r * 255), int(g * 255), int(b * 255))
+        return RGB._unchecked(*_hsl_to_rgb(self.h, self.s, self.l))
 
     def to_hex(self) -> str:
         return self.to_rgb().to_hex()
@@ -73,16 +203,16 @@ class HSL:
         return f"hsl({self.h}, {self.s}%, {self.l}%)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HSV:
     h: int  # 0-360
     s: int  # 0-100
     v: int  # 0-100
 
     def __post_init__(self):
-        self.h = self.h % 360
-        self.s = max(0, min(100, self.s))
-        self.v = max(0, min(100, self.v))
+        object.__setattr__(self, "h", self.h % 360)
+        object.__setattr__(self, "s", max(0, min(100, self.s)))
+        object.__setattr__(self, "v", max(0, min(100, self.v)))
 
     def to_rgb(self) -> RGB:
         h, s, v = self.h / 360, self.s / 100, self.v / 100
@@ -93,122 +223,206 @@ class HSV:
         return self.to_rgb().to_hex()
 
 
-class Color:
-    def __init__(self, color: Union[str, RGB, HSL, HSV, Tuple[int, int, int]]):
-        if isinstance(color, str):
-            self.rgb = self._parse_string(color)
-        elif isinstance(color, RGB):
-            self.rgb = color
-        elif isinstance(color, HSL):
-            self.rgb = color.to_rgb()
-        elif isinstance(color, HSV):
-            self.rgb = color.to_rgb()
-        elif isinstance(color, tuple):
-            self.rgb = RGB(*color)
-        else:
-            raise ValueError(f"Unknown color format: {type(color)}")
-
-    def _parse_string(self, color: str) -> RGB:
-        color = color.strip().lower()
-        
-        if color.startswith("#"):
-            return self._parse_hex(color)
-        elif color.startswith("rgb"):
-            return self._parse_rgb_string(color)
-        elif color.startswith("hsl"):
-            return self._parse_hsl_string(color)
-        elif color in NAMED_COLORS:
-            return self._parse_hex(NAMED_COLORS[color])
-        
-        raise ValueError(f"Unknown color format: {color}")
-
-    def _parse_hex(self, hex_str: str) -> RGB:
-        hex_str = hex_str.lstrip("#")
-        if len(hex_str) == 3:
-            hex_str = "".join(c * 2 for c in hex_str)
-        return RGB(
-            int(hex_str[0:2], 16),
-            int(hex_str[2:4], 16),
-            int(hex_str[4:6], 16)
-        )
+@lru_cache(maxsize=512)
+def _parse_string_cached(color: str) -> Tuple[int, int, int]:
+    # Returns a tuple rather than an RGB so cached entries can't be mutated
+    color = color.strip().lower()
+
+    if color in _NAMED_RGB:
+        return _NAMED_RGB[color]
+
+    match = _COLOR_RE.match(color)
+    if match:
+        kind = match.lastgroup
+        if kind == "hex":
+            return _parse_hex(match.group("hex"))
+        elif kind == "b":
+            return RGB(int(match.group("r")), int(match.group("g")), int(match.group("b"))).to_tuple()
+        return HSL(int(match.group("h")), int(match.group("s")), int(match.group("l"))).to_rgb().to_tuple()
+
+    # Irregular hex strings still go through the lenient hex parser
+    if color.startswith("#"):
+        return _parse_hex(color)
+    elif color.startswith("rgb"):
+        raise ValueError(f"Invalid RGB string: {color}")
+    elif color.startswith("hsl"):
+        raise ValueError(f"Invalid HSL string: {color}")
+
+    raise ValueError(f"Unknown color format: {color}")
+
+
+@lru_cache(maxsize=512)
+def _parse_hex(hex_str: str) -> Tuple[int, int, int]:
+    hex_str = hex_str.lstrip("#")
+    if len(hex_str) == 3:
+        hex_str = "".join(c * 2 for c in hex_str)
+    return (
+        int(hex_str[0:2], 16),
+        int(hex_str[2:4], 16),
+        int(hex_str[4:6], 16)
+    )
 
-    def _parse_rgb_string(self, rgb_str: str) -> RGB:
-        match = re.match(r"rgba?\((\d+),\s*(\d+),\s*(\d+)", rgb_str)
-        if match:
-            return RGB(int(match.group(1)), int(match.group(2)), int(match.group(3)))
-        raise ValueError(f"Invalid RGB string: {rgb_str}")
 
-    def _parse_hsl_string(self, hsl_str: str) -> RGB:
-        match = re.match(r"hsla?\((\d+),\s*(\d+)%?,\s*(\d+)%?", hsl_str)
-        if match:
-            return HSL(int(match.group(1)), int(match.group(2)), int(match.group(3))).to_rgb()
-        raise ValueError(f"Invalid HSL string: {hsl_str}")
+def _from_string(color: str) -> Tuple[RGB, Optional[HSL]]:
+    return RGB(*_parse_string_cached(color)), None
+
+
+def _from_rgb(color: RGB) -> Tuple[RGB, Optional[HSL]]:
+    return color, None
+
+
+def _from_hsl(color: HSL) -> Tuple[RGB, Optional[HSL]]:
+    # HSL is frozen, so it can double as the cached hsl() value
+    return color.to_rgb(), color
+
+
+def _from_hsv(color: HSV) -> Tuple[RGB, Optional[HSL]]:
+    return color.to_rgb(), None
+
+
+def _from_tuple(color: Tuple[int, int, int]) -> Tuple[RGB, Optional[HSL]]:
+    return RGB(*color), None
+
+
+# Color.__init__ dispatch, keyed on the exact input type
+_COLOR_CTORS = {
+    str: _from_string,
+    RGB: _from_rgb,
+    HSL: _from_hsl,
+    HSV: _from_hsv,
+    tuple: _from_tuple,
+}
+
+
+class Color:
+    # Colors are treated as immutable, so derived values are cached lazily
+    __slots__ = ("_rgb", "_hsl", "_lum", "_hex", "__weakref__")
+
+    def __init__(self, color: Union[str, RGB, HSL, HSV, Tuple[int, int, int]]):
+        ctor = _COLOR_CTORS.get(type(color))
+        if ctor is None:
+            # Subclasses (str enums, namedtuples, ...) fall back to an MRO walk
+            ctor = next((_COLOR_CTORS[t] for t in type(color).__mro__ if t in _COLOR_CTORS), None)
+            if ctor is None:
+                raise ValueError(f"Unknown color format: {type(color)}")
+        self._rgb, self._hsl = ctor(color)
+        self._lum = None
+        self._hex = None
+
+    @classmethod
+    def _wrap_rgb(cls, rgb: RGB, hsl: Optional[HSL] = None) -> "Color":
+        """Wrap an existing RGB (and optionally its HSL) without the __init__ type dispatch."""
+        color = object.__new__(cls)
+        color._rgb = rgb
+        color._hsl = hsl
+        color._lum = None
+        color._hex = None
+        return color
+
+    @classmethod
+    def _from_hsl_unchecked(cls, h: int, s: int, l: int) -> "Color":
+        """Build a Color from in-range HSL components, caching the HSL alongside the RGB."""
+        return cls._wrap_rgb(RGB._unchecked(*_hsl_to_rgb(h, s, l)), HSL._unchecked(h, s, l))
+
+    @property
+    def rgb(self) -> RGB:
+        # Read-only: the cached hex/hsl/luminance are never invalidated
+        return self._rgb
 
     def hex(self) -> str:
-        return self.rgb.to_hex()
+        if self._hex is None:
+            self._hex = self._rgb.to_hex()
+        return self._hex
 
     def hsl(self) -> HSL:
-        return self.rgb.to_hsl()
+        if self._hsl is None:
+            self._hsl = self._rgb.to_hsl()
+        return self._hsl
 
     def hsv(self) -> HSV:
-        return self.rgb.to_hsv()
+        return self._rgb.to_hsv()
+
+    def luminance(self) -> float:
+        if self._lum is None:
+            self._lum = self._rgb.luminance()
+        return self._lum
 
     def lighten(self, amount: int = 10) -> "Color":
-        hsl = self.rgb.to_hsl()
-        hsl.l = min(100, hsl.l + amount)
-        return Color(hsl)
+        hsl = self.hsl()
+        return Color._from_hsl_unchecked(hsl.h, hsl.s, max(0, min(100, hsl.l + amount)))
 
     def darken(self, amount: int = 10) -> "Color":
-        hsl = self.rgb.to_hsl()
-        hsl.l = max(0, hsl.l - amount)
-        return Color(hsl)
+        hsl = self.hsl()
+        return Color._from_hsl_unchecked(hsl.h, hsl.s, max(0, min(100, hsl.l - amount)))
 
     def saturate(self, amount: int = 10) -> "Color":
-        hsl = self.rgb.to_hsl()
-        hsl.s = min(100, hsl.s + amount)
-        return Color(hsl)
+        hsl = self.hsl()
+        return Color._from_hsl_unchecked(hsl.h, max(0, min(100, hsl.s + amount)), hsl.l)
 
     def desaturate(self, amount: int = 10) -> "Color":
-        hsl = self.rgb.to_hsl()
-        hsl.s = max(0, hsl.s - amount)
-        return Color(hsl)
+        hsl = self.hsl()
+        return Color._from_hsl_unchecked(hsl.h, max(0, min(100, hsl.s - amount)), hsl.l)
 
     def invert(self) -> "Color":
-        return Color(RGB(255 - self.rgb.r, 255 - self.rgb.g, 255 - self.rgb.b))
+        return Color._wrap_rgb(RGB._unchecked(255 - self._rgb.r, 255 - self._rgb.g, 255 - self._rgb.b))
 
     def grayscale(self) -> "Color":
-        gray = int(self.rgb.luminance() * 255)
-        return Color(RGB(gray, gray, gray))
+        gray = int(self.luminance() * 255)
+        return Color._wrap_rgb(RGB._unchecked(gray, gray, gray))
 
     def complement(self) -> "Color":
-        hsl = self.rgb.to_hsl()
-        hsl.h = (hsl.h + 180) % 360
-        return Color(hsl)
+        hsl = self.hsl()
+        return Color._from_hsl_unchecked((hsl.h + 180) % 360, hsl.s, hsl.l)
 
     def blend(self, other: "Color", ratio: float = 0.5) -> "Color":
-        r = int(self.rgb.r * (1 - ratio) + other.rgb.r * ratio)
-        g = int(self.rgb.g * (1 - ratio) + other.rgb.g * ratio)
-        b = int(self.rgb.b * (1 - ratio) + other.rgb.b * ratio)
-        return Color(RGB(r, g, b))
+        # Fixed-point blend: ratio is quantised to k/256 and the mix stays in ints.
+        # Channels go through int() so numpy scalar channels can't overflow.
+        k = int(ratio * 256)
+        inv = 256 - k
+        a, o = self._rgb, other.rgb
+        r = (int(a.r) * inv + int(o.r) * k) >> 8
+        g = (int(a.g) * inv + int(o.g) * k) >> 8
+        b = (int(a.b) * inv + int(o.b) * k) >> 8
+        if 0 <= ratio <= 1:
+            return Color._wrap_rgb(RGB._unchecked(r, g, b))
+        return Color._wrap_rgb(RGB(r, g, b))
 
     def contrast_ratio(self, other: "Color") -> float:
-        l1 = self.rgb.luminance() + 0.05
-        l2 = other.rgb.luminance() + 0.05
-        return max(l1, l2) / min(l1, l2)
+        l1 = self.luminance() + 0.05
+        l2 = other.luminance() + 0.05
+        return l1 / l2 if l1 > l2 else l2 / l1
 
     def is_light(self) -> bool:
-        return self.rgb.is_light()
+        return self.luminance() > 0.5
+
+
+def _analogous_hues(hue: int, count: int, spread: int) -> List[int]:
+    start = hue - (spread * (count - 1) // 2)
+    return [(start + spread * i) % 360 for i in range(count)]
+
+
+def _monochromatic_lights(lightness: int, count: int) -> List[int]:
+    step = 80 // count
+    start = max(10, lightness - step * count // 2)
+    return [min(90, start + step * i) for i in range(count)]
 
 
 class Palette:
     @staticmethod
     def analogous(base: Color, count: int = 5, spread: int = 30) -> List[Color]:
         hsl = base.hsl()
-        colors = []
-        start = hsl.h - (spread * (count - 1) // 2)
-        for i in range(count):
-            colors.append(Color(HSL((start + spread * i) % 360, hsl.s, hsl.l)))
-        return colors
+        sh, sl = hsl.s, hsl.l
+        return [Color._from_hsl_unchecked(h, sh, sl) for h in _analogous_hues(hsl.h, count, spread)]
+
+    @staticmethod
+    def analogous_batch(bases: "np.ndarray", count: int = 5, spread: int = 30) -> "np.ndarray":
+        """Analogous palettes for an (N, 3) uint8 array of base colors, as an (N, count, 3) uint8 array."""
+        if np is None:
+            raise ImportError("analogous_batch requires numpy")
+        h, s, l = _rgb_array_to_hsl(np.asarray(bases).reshape(-1, 3))
+        offsets = np.array(_analogous_hues(0, count, spread), dtype=int)
+        hues = (h[:, None] + offsets[None, :]) % 360
+        return _hsl_array_to_rgb(hues, s[:, None], l[:, None]).astype(np.uint8)
 
     @staticmethod
     def complementary(base: Color) -> List[Color]:
@@ -219,8 +433,8 @@ class Palette:
         hsl = base.hsl()
         return [
             base,
-            Color(HSL((hsl.h + 120) % 360, hsl.s, hsl.l)),
-            Color(HSL((hsl.h + 240) % 360, hsl.s, hsl.l))
+            Color._from_hsl_unchecked((hsl.h + 120) % 360, hsl.s, hsl.l),
+            Color._from_hsl_unchecked((hsl.h + 240) % 360, hsl.s, hsl.l)
         ]
 
     @staticmethod
@@ -228,28 +442,119 @@ class Palette:
         hsl = base.hsl()
         return [
             base,
-            Color(HSL((hsl.h + 180 - spread) % 360, hsl.s, hsl.l)),
-            Color(HSL((hsl.h + 180 + spread) % 360, hsl.s, hsl.l))
+            Color._from_hsl_unchecked((hsl.h + 180 - spread) % 360, hsl.s, hsl.l),
+            Color._from_hsl_unchecked((hsl.h + 180 + spread) % 360, hsl.s, hsl.l)
         ]
 
     @staticmethod
     def monochromatic(base: Color, count: int = 5) -> List[Color]:
         hsl = base.hsl()
-        colors = []
-        step = 80 // count
-        start = max(10, hsl.l - step * count // 2)
-        for i in range(count):
-            colors.append(Color(HSL(hsl.h, hsl.s, min(90, start + step * i))))
-        return colors
+        hh, sh = hsl.h, hsl.s
+        return [Color._from_hsl_unchecked(hh, sh, l) for l in _monochromatic_lights(hsl.l, count)]
 
     @staticmethod
     def gradient(start: Color, end: Color, steps: int = 5) -> List[Color]:
+        # Scalar loop; use gradient_array/gradient_bulk for vectorized output
         colors = []
         for i in range(steps):
             ratio = i / (steps - 1) if steps > 1 else 0
             colors.append(start.blend(end, ratio))
         return colors
 
+    @staticmethod
+    def gradient_array(start: Color, end: Color, steps: int = 5) -> "np.ndarray":
+        """Return the gradient as a ``(steps, 3)`` uint8 array (requires numpy)."""
+        if np is None:
+            raise ImportError("gradient_array requires numpy")
+        s = np.array(start.rgb.to_tuple(), dtype=np.uint16)
+        e = np.array(end.rgb.to_tuple(), dtype=np.uint16)
+        # i / (steps - 1) rather than linspace so weights match Color.blend exactly
+        ratios = np.arange(steps, dtype=float)[:, None] / (steps - 1 if steps > 1 else 1)
+        k = (ratios * 256).astype(np.uint16)
+        return ((s * (256 - k) + e * k) >> 8).astype(np.uint8)
+
+    @staticmethod
+    def gradient_bulk(start: Color, end: Color, steps: int = 5) -> "np.ndarray":
+        """Like gradient_array, but filled by a compiled kernel when one is available."""
+        if np is None:
+            raise ImportError("gradient_bulk requires numpy")
+        if _ckernels is not None:
+            out = np.empty((max(steps, 0), 3), dtype=np.uint8)
+            s = np.array(start.rgb.to_tuple(), dtype=np.uint8)
+            e = np.array(end.rgb.to_tuple(), dtype=np.uint8)
+            _ckernels.gradient_rgb(s, e, out)
+            return out
+        if _kernels is None:
+            return Palette.gradient_array(start, end, steps)
+        s = np.array(start.rgb.to_tuple(), dtype=np.int64)
+        e = np.array(end.rgb.to_tuple(), dtype=np.int64)
+        return _kernels.gradient(s, e, max(steps, 0))
+
+
+class PaletteArray:
+    """A palette stored as parallel uint8 ``r``, ``g``, ``b`` arrays (requires numpy)."""
+
+    __slots__ = ("r", "g", "b")
+
+    def __init__(self, r: "np.ndarray", g: "np.ndarray", b: "np.ndarray"):
+        if np is None:
+            raise ImportError("PaletteArray requires numpy")
+        self.r = np.ascontiguousarray(r, dtype=np.uint8)
+        self.g = np.ascontiguousarray(g, dtype=np.uint8)
+        self.b = np.ascontiguousarray(b, dtype=np.uint8)
+
+    @classmethod
+    def from_rgb(cls, rows: "np.ndarray") -> "PaletteArray":
+        if np is None:
+            raise ImportError("PaletteArray requires numpy")
+        rows = np.asarray(rows).reshape(-1, 3)
+        return cls(rows[:, 0], rows[:, 1], rows[:, 2])
+
+    @classmethod
+    def from_colors(cls, colors: List[Color]) -> "PaletteArray":
+        return cls.from_rgb([c.rgb.to_tuple() for c in colors])
+
+    @classmethod
+    def analogous(cls, base: Color, count: int = 5, spread: int = 30) -> "PaletteArray":
+        if np is None:
+            raise ImportError("PaletteArray requires numpy")
+        hsl = base.hsl()
+        hues = np.array(_analogous_hues(hsl.h, count, spread), dtype=int)
+        return cls.from_rgb(_hsl_array_to_rgb(hues, hsl.s, hsl.l))
+
+    @classmethod
+    def monochromatic(cls, base: Color, count: int = 5) -> "PaletteArray":
+        if np is None:
+            raise ImportError("PaletteArray requires numpy")
+        hsl = base.hsl()
+        lights = np.array(_monochromatic_lights(hsl.l, count), dtype=int)
+        return cls.from_rgb(_hsl_array_to_rgb(hsl.h, hsl.s, lights))
+
+    @classmethod
+    def gradient(cls, start: Color, end: Color, steps: int = 5) -> "PaletteArray":
+        return cls.from_rgb(Palette.gradient_array(start, end, steps))
+
+    def __len__(self) -> int:
+        return len(self.r)
+
+    def __iter__(self):
+        for r, g, b in zip(self.r.tolist(), self.g.tolist(), self.b.tolist()):
+            yield Color._wrap_rgb(RGB._unchecked(r, g, b))
+
+    def to_array(self) -> "np.ndarray":
+        return np.stack((self.r, self.g, self.b), axis=-1)
+
+    def to_hex_list(self) -> List[str]:
+        hexes = np.char.add(np.take(_HEX_ARRAY, self.r), np.take(_HEX_ARRAY, self.g))
+        hexes = np.char.add(hexes, np.take(_HEX_ARRAY, self.b))
+        return np.char.add("#", hexes).tolist()
+
+    def to_css_list(self) -> List[str]:
+        return [
+            f"rgb({r}, {g}, {b})"
+            for r, g, b in zip(self.r.tolist(), self.g.tolist(), self.b.tolist())
+        ]
+
 
 NAMED_COLORS = {
     "black": "#000000", "white": "#ffffff", "red": "#ff0000",
@@ -261,6 +566,12 @@ NAMED_COLORS = {
     "aqua": "#00ffff", "lime": "#00ff00", "silver": "#c0c0c0",
 }
 
+# Pre-parsed (r, g, b) for NAMED_COLORS so name lookups skip hex parsing
+_NAMED_RGB = {
+    name: (int(h[1:3], 16), int(h[3:5], 16), int(h[5:7], 16))
+    for name, h in NAMED_COLORS.items()
+}
+
 
 def example_usage():
     c1 = Color("#ff6b6b")
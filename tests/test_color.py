@@ -0,0 +1,202 @@
+import collections
+import dataclasses
+import enum
+import random
+import warnings
+import weakref
+
+import pytest
+
+from roadcolor import color
+from roadcolor.color import HSL, RGB, Color, Palette, PaletteArray
+
+
+def _random_rgbs(n, seed=0):
+    rng = random.Random(seed)
+    return [tuple(rng.randrange(256) for _ in range(3)) for _ in range(n)]
+
+
+EDGE_RGBS = [(0, 0, 0), (255, 255, 255), (128, 128, 128), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+def test_blend_with_numpy_channels():
+    np = pytest.importorskip("numpy")
+    c = Color(tuple(np.array([200, 100, 50], np.uint8)))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert c.blend(Color("white")).hex() == "#e3b198"
+        assert c.blend(Color("black")).hex() == "#643219"
+    assert c.blend(Color("white")).hex() == Color((200, 100, 50)).blend(Color("white")).hex()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("red", "#ff0000"),
+    (" RED ", "#ff0000"),
+    ("#abc", "#aabbcc"),
+    ("#ABCDEF", "#abcdef"),
+    ("#abcdefzz", "#abcdef"),
+    ("#12345", "#123405"),
+    ("##abc", "#aabbcc"),
+    ("rgb(300, 1, 2)", "#ff0102"),
+    ("rgba(1,2,3,0.5)", "#010203"),
+    ("hsl(0, 100%, 50%)", "#ff0000"),
+    ("hsla(120,100,50)", "#00ff00"),
+])
+def test_parse_string(text, expected):
+    assert Color(text).hex() == expected
+
+
+@pytest.mark.parametrize("text", ["nope", "#1234", "#abcxyz", "rgb(x)", "hsl()"])
+def test_parse_string_rejects(text):
+    with pytest.raises(ValueError):
+        Color(text)
+
+
+def test_parse_cache_is_not_shared():
+    a, b = Color("red"), Color("red")
+    assert a.rgb is not b.rgb
+    assert a.rgb == b.rgb == RGB(255, 0, 0)
+    assert color._parse_string_cached("red") == (255, 0, 0)
+    assert type(color._parse_string_cached("red")) is tuple
+
+
+def test_construct_from_subclasses():
+    class Named(str, enum.Enum):
+        RED = "red"
+
+    Point = collections.namedtuple("Point", "r g b")
+    assert Color(Named.RED).hex() == "#ff0000"
+    assert Color(Point(1, 2, 3)).rgb == RGB(1, 2, 3)
+    with pytest.raises(ValueError):
+        Color([1, 2, 3])
+
+
+def test_luminance_and_grayscale():
+    c = Color("#ff6b6b")
+    assert c.luminance() == c.rgb.luminance()
+    assert Color((35, 35, 35)).grayscale().hex() == "#232323"
+    assert Color("white").grayscale().hex() == "#ffffff"
+    assert Color("black").grayscale().hex() == "#000000"
+
+
+def test_lighten_darken_round_trip():
+    c = Color(HSL(200, 50, 40))
+    assert c.lighten(10).hsl() == HSL(200, 50, 50)
+    assert c.lighten(10).darken(10).hsl() == HSL(200, 50, 40)
+    assert c.lighten(90).hsl().l == 100 and c.darken(90).hsl().l == 0
+
+
+def test_color_keeps_source_hsl():
+    hsl = HSL(200, 50, 40)
+    assert Color(hsl).hsl() is hsl
+    assert Color(hsl).rgb == Color(Color(hsl).hex()).rgb
+
+
+def test_gradient_array_matches_gradient():
+    pytest.importorskip("numpy")
+    for a, b in zip(_random_rgbs(50, 1), _random_rgbs(50, 2)):
+        start, end = Color(a), Color(b)
+        for steps in (0, 1, 2, 5, 33):
+            expected = [c.rgb.to_tuple() for c in Palette.gradient(start, end, steps)]
+            assert [tuple(row) for row in Palette.gradient_array(start, end, steps).tolist()] == expected
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_gradient_bulk_matches_gradient(monkeypatch, compiled):
+    pytest.importorskip("numpy")
+    if compiled and color._ckernels is None:
+        pytest.skip("_ckernels not available")
+    if not compiled:
+        monkeypatch.setattr(color, "_ckernels", None)
+    for a, b in zip(_random_rgbs(50, 1), _random_rgbs(50, 2)):
+        start, end = Color(a), Color(b)
+        for steps in (0, 1, 2, 5, 33):
+            expected = [c.rgb.to_tuple() for c in Palette.gradient(start, end, steps)]
+            assert [tuple(row) for row in Palette.gradient_bulk(start, end, steps).tolist()] == expected
+
+
+def test_palette_array_matches_palette():
+    pytest.importorskip("numpy")
+    for rgb in EDGE_RGBS + _random_rgbs(200):
+        base = Color(rgb)
+        pairs = [
+            (PaletteArray.analogous(base, 7, 45), Palette.analogous(base, 7, 45)),
+            (PaletteArray.monochromatic(base, 6), Palette.monochromatic(base, 6)),
+            (PaletteArray.gradient(base, Color("navy"), 9), Palette.gradient(base, Color("navy"), 9)),
+        ]
+        for array, colors in pairs:
+            assert len(array) == len(colors)
+            assert array.to_hex_list() == [c.hex() for c in colors]
+            assert [c.hex() for c in array] == [c.hex() for c in colors]
+            assert PaletteArray.from_colors(colors).to_hex_list() == array.to_hex_list()
+    assert PaletteArray.from_rgb([[1, 2, 3]]).to_css_list() == ["rgb(1, 2, 3)"]
+
+
+@pytest.mark.parametrize("use_kernels", [True, False])
+def test_analogous_batch_matches_analogous(monkeypatch, use_kernels):
+    np = pytest.importorskip("numpy")
+    if use_kernels and color._kernels is None:
+        pytest.skip("numba kernels not available")
+    if not use_kernels:
+        monkeypatch.setattr(color, "_kernels", None)
+    rgbs = EDGE_RGBS + _random_rgbs(500)
+    bases = np.array(rgbs, dtype=np.uint8)
+    for count, spread in ((5, 30), (7, 45), (1, 10), (4, -20), (0, 30)):
+        out = Palette.analogous_batch(bases, count, spread)
+        assert out.shape == (len(rgbs), count, 3) and out.dtype == np.uint8
+        expected = [
+            [c.rgb.to_tuple() for c in Palette.analogous(Color(rgb), count, spread)]
+            for rgb in rgbs
+        ]
+        assert [[tuple(p) for p in row] for row in out.tolist()] == expected
+
+
+@pytest.mark.parametrize("use_kernels", [True, False])
+def test_array_conversions_match_scalar(monkeypatch, use_kernels):
+    np = pytest.importorskip("numpy")
+    if use_kernels and color._kernels is None:
+        pytest.skip("numba kernels not available")
+    if not use_kernels:
+        monkeypatch.setattr(color, "_kernels", None)
+    rgbs = EDGE_RGBS + _random_rgbs(2000)
+    h, s, l = color._rgb_array_to_hsl(np.array(rgbs, dtype=np.uint8))
+    assert list(zip(h.tolist(), s.tolist(), l.tolist())) == [color._rgb_to_hsl_py(*rgb) for rgb in rgbs]
+
+    grid = [(hh, ss, ll) for hh in range(0, 360, 7) for ss in range(0, 101, 5) for ll in range(0, 101, 5)]
+    hs, ss, ls = (np.array(v) for v in zip(*grid))
+    out = color._hsl_array_to_rgb(hs, ss, ls)
+    assert [tuple(row) for row in out.tolist()] == [color._hsl_to_rgb_py(*hsl) for hsl in grid]
+
+
+@pytest.mark.parametrize("name", ["_kernels", "_ckernels"])
+def test_scalar_kernels_match_python(name):
+    kernels = getattr(color, name)
+    if kernels is None:
+        pytest.skip(f"{name} not available")
+    for rgb in EDGE_RGBS + _random_rgbs(5000):
+        assert kernels.rgb_to_hsl(*rgb) == color._rgb_to_hsl_py(*rgb)
+    for h in range(0, 360, 3):
+        for s in range(0, 101, 4):
+            for l in range(0, 101, 4):
+                assert kernels.hsl_to_rgb(h, s, l) == color._hsl_to_rgb_py(h, s, l)
+
+
+def test_rgb_and_hsl_are_frozen():
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        RGB(1, 2, 3).r = 5
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        HSL(1, 2, 3).l = 5
+
+
+def test_rgb_is_read_only():
+    c = Color((10, 20, 30))
+    assert c.hex() == "#0a141e"
+    with pytest.raises(AttributeError):
+        c.rgb = RGB(200, 200, 200)
+    assert c.rgb == RGB(10, 20, 30)
+    assert c.hex() == "#0a141e"
+
+
+def test_color_supports_weakref():
+    c = Color("red")
+    assert weakref.ref(c)() is c